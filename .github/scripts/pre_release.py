@@ -1,30 +1,97 @@
-import importlib.metadata
+import functools
+import pathlib
 import re
+import sys
+import typing
+from concurrent.futures import ThreadPoolExecutor
 
 import requests
+from packaging.version import Version
 
 import discapty
 
+try:
+    import requests_cache
+except ImportError:  # pragma: no cover
+    requests_cache = None
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+if sys.version_info >= (3, 11):
+    import tomllib
+else:  # pragma: no cover
+    tomllib = None
+
+PYPROJECT_FILE = pathlib.Path(__file__).resolve().parents[2] / "pyproject.toml"
+
 REG = re.compile(r"^version = \"(.*)\"")
+# I hope the guy who made this regex rests in peace.
+if sys.version_info >= (3, 11):
+    # Possessive quantifiers are only supported since 3.11, they avoid backtracking on
+    # near-miss versions.
+    PEP440_REG = re.compile(
+        r"^([1-9][0-9]*+!)?+(0|[1-9][0-9]*+)(\.(0|[1-9][0-9]*+))*+((a|b|rc)(0|[1-9][0-9]*+))?+(\.post(0|[1-9][0-9]*+))?+(\.dev(0|[1-9][0-9]*+))?+$"
+    )
+else:
+    PEP440_REG = re.compile(
+        r"^([1-9][0-9]*!)?(0|[1-9][0-9]*)(\.(0|[1-9][0-9]*))*((a|b|rc)(0|[1-9][0-9]*))?(\.post(0|[1-9][0-9]*))?(\.dev(0|[1-9][0-9]*))?$"
+    )
+
+
+SIMPLE_VERSION_CHARS = frozenset("0123456789.")
+
+
+class ReleaseCheckError(Exception):
+    """
+    Raised when a pre-release check fails.
+    """
+
+
+def is_simple_version(version: str) -> bool:
+    # Plain releases such as "2.1.2" don't need to go through the PEP 440 regex.
+    if not SIMPLE_VERSION_CHARS.issuperset(version):
+        return False
+    return all(segment and (segment == "0" or segment[0] != "0") for segment in version.split("."))
 
 
 def check_local_version_is_valid(local_version: str):
-    # I hope the guy who made this regex rests in peace.
-    regex = re.match(
-        r"^([1-9][0-9]*!)?(0|[1-9][0-9]*)(\.(0|[1-9][0-9]*))*((a|b|rc)(0|[1-9][0-9]*))?(\.post(0|[1-9][0-9]*))?(\.dev(0|[1-9][0-9]*))?$",
-        local_version,
-    )
-    if regex is None:
-        print(f"[Valid Local] Local version is not valid: {local_version}")
-        exit(1)
+    if not is_simple_version(local_version) and PEP440_REG.match(local_version) is None:
+        raise ReleaseCheckError(f"[Valid Local] Local version is not valid: {local_version}")
     print("[Valid Local] OK")
 
 
+@functools.lru_cache(maxsize=1)
+def fetch_remote_versions() -> typing.Tuple[str, ...]:
+    # Get DisCapTy's versions on PyPi's simple JSON API, which is much lighter than the
+    # project's full JSON metadata.
+    # The cache file is persisted between CI runs, see prepare-release.yml. Cached responses
+    # are always revalidated using their ETag/Last-Modified, so an unchanged index is answered
+    # by an empty "304 Not Modified".
+    if requests_cache is not None:
+        session = requests_cache.CachedSession(
+            ".pypi-cache", expire_after=3600, always_revalidate=True
+        )
+    else:
+        session = requests.Session()
+    r = session.get(
+        "https://pypi.org/simple/discapty/",
+        headers={"Accept": "application/vnd.pypi.simple.v1+json"},
+        timeout=10,
+    )
+    data = orjson.loads(r.content) if orjson is not None else r.json()
+    return tuple(data["versions"])
+
+
 def check_pypi_version(local_version: str):
-    # Get DisCapTy's version on PyPi's JSON API.
-    r = requests.get("https://pypi.python.org/pypi/discapty/json")
-    data = r.json()
-    remote_version = data["info"]["version"]
+    remote_versions = fetch_remote_versions()
+    # The index lists every version, the latest release is reported like PyPi's "info.version"
+    # did, unless there are only pre-releases.
+    parsed_versions = [Version(version) for version in remote_versions]
+    releases = [version for version in parsed_versions if not version.is_prerelease]
+    remote_version = max(releases or parsed_versions)
 
     print(f"[PyPi] Remote version: {remote_version}")
 
@@ -32,25 +99,37 @@ def check_pypi_version(local_version: str):
     print(f"::set-output name=local_version::{local_version}")
     print(f"::set-output name=remote_version::{remote_version}")
 
-    if local_version == remote_version:
-        # The local & the remote version are the same: PyPi will reject the upload
-        print(
-            "[PyPi] Local version and remote version are the same, the version must be updated "
-            "first!"
+    if local_version in remote_versions:
+        # The local version already exists on PyPi: PyPi will reject the upload
+        raise ReleaseCheckError(
+            "[PyPi] Local version has already been released, the version must be updated first!"
         )
-        exit(1)
 
     print("[PyPi] OK")
 
 
 def check_local_version_against_pyproject(discapty_version: str):
-    pyproject_version = importlib.metadata.version("discapty")
+    if tomllib is not None:
+        # Reading pyproject.toml directly is cheaper than walking the installed dist-info.
+        data = tomllib.loads(PYPROJECT_FILE.read_text(encoding="utf-8"))
+        pyproject_version = data["tool"]["poetry"]["version"]
+    else:
+        # Stop at the first "version = ..." line instead of reading the whole file.
+        with PYPROJECT_FILE.open(encoding="utf-8") as f:
+            for line in f:
+                match = REG.fullmatch(line.rstrip())
+                if match:
+                    pyproject_version = match.group(1)
+                    break
+            else:
+                raise LookupError(f"No version found in {PYPROJECT_FILE}")
 
     print(f"[PyProject] PyProject version: {pyproject_version}")
 
     if discapty_version != pyproject_version:
-        print("Local version and PyProject version does not match, please fix it first!")
-        exit(1)
+        raise ReleaseCheckError(
+            "[PyProject] Local version and PyProject version does not match, please fix it first!"
+        )
 
     print("[PyProject] OK")
 
@@ -61,9 +140,28 @@ def main():
     discapty_version = discapty.__version__
     print(f"[Meta] Local version: {discapty_version}")
 
-    check_local_version_is_valid(discapty_version)
-    check_pypi_version(discapty_version)
-    check_local_version_against_pyproject(discapty_version)
+    # Checks are independent from each other, run them all at once and report every failure.
+    checks = (
+        check_local_version_is_valid,
+        check_pypi_version,
+        check_local_version_against_pyproject,
+    )
+    with ThreadPoolExecutor(len(checks)) as executor:
+        futures = [executor.submit(check, discapty_version) for check in checks]
+
+    # Only failed checks are reported. Any other exception is a bug or an outage and is raised
+    # with its traceback.
+    errors: typing.List[ReleaseCheckError] = []
+    for future in futures:
+        try:
+            future.result()
+        except ReleaseCheckError as error:
+            errors.append(error)
+
+    if errors:
+        for error in errors:
+            print(error)
+        exit(1)
 
     print("[Meta] All checks are good, ready to deploy package at your command!")
 
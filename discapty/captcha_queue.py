@@ -1,5 +1,9 @@
+from __future__ import annotations
+
 import random
+import time
 import typing
+from collections import OrderedDict
 
 from discapty.challenge import Challenge
 from discapty.errors import NonexistingChallengeError
@@ -7,6 +11,8 @@ from discapty.generators import Generator
 
 _GR = typing.TypeVar("_GR", covariant=True)
 
+_MISSING: typing.Any = object()
+
 
 class CaptchaQueue(typing.Generic[_GR]):
     """
@@ -26,11 +32,31 @@ class CaptchaQueue(typing.Generic[_GR]):
 
     queue : Dict[:py:class:`str`, :py:class:`discapty.challenge.Challenge`]
         Import an existing queue. Shouldn't be required.
+        The given dict is copied, changes made to it afterward are not seen by the queue.
+
+    max_size : Optional, :py:class:`int`
+        The maximum number of challenges to keep in the queue. When exceeded, the least recently
+        used challenges are dropped. Dropped challenges are not cancelled. Must be at least 1.
+        Defaults to no limit.
+
+    default_retries : Optional, :py:class:`int`
+        The number of allowed retries of the created challenges, unless given to
+        :py:func:`create_challenge <discapty.captcha_queue.CaptchaQueue.create_challenge>`.
+        Defaults to 3.
+
+    default_code_length : Optional, :py:class:`int`
+        The length of the codes generated for the created challenges, unless given to
+        :py:func:`create_challenge <discapty.captcha_queue.CaptchaQueue.create_challenge>`.
+        Defaults to 4.
+
+    ttl : Optional, :py:class:`float`
+        The number of seconds after which a challenge that has not been created or obtained
+        again is dropped from the queue. Defaults to no expiry.
 
     Raises
     ------
     :py:exc:`ValueError` :
-        If no generators has been passed.
+        If no generators has been passed, or if ``max_size`` is lower than 1.
 
 
     .. versionadded:: 2.0.0
@@ -41,36 +67,88 @@ class CaptchaQueue(typing.Generic[_GR]):
        (If necessary)
        If the type is not especially indicated in your variable, it should be automatically done.
 
+    .. versionchanged:: 2.2.0
+
+       Added the ``max_size``, ``default_retries``, ``default_code_length`` and ``ttl``
+       parameters.
+       ``generators`` is now a tuple.
+       The imported ``queue`` is now copied into an ordered dict instead of being used as is.
+
     """
 
-    generators: typing.List[Generator[_GR]]
-    queue: typing.Dict[str, Challenge[_GR]]
+    __slots__ = (
+        "generators",
+        "queue",
+        "max_size",
+        "default_retries",
+        "default_code_length",
+        "ttl",
+        "__total_challenges",
+        "__last_access",
+    )
+
+    generators: tuple[Generator[_GR], ...]
+    queue: OrderedDict[str, Challenge[_GR]]
+    max_size: int | None
+    default_retries: int | None
+    default_code_length: int | None
+    ttl: float | None
     __total_challenges: int
+    __last_access: dict[str, float]
 
     def __init__(
         self,
-        generators: typing.Union[
-            Generator[_GR],
-            typing.Iterable[Generator[_GR]],
-        ],
+        generators: Generator[_GR] | typing.Iterable[Generator[_GR]],
         *,
-        queue: typing.Optional[typing.Dict[str, Challenge[_GR]]] = None,
+        queue: dict[str, Challenge[_GR]] | None = None,
+        max_size: int | None = None,
+        default_retries: int | None = None,
+        default_code_length: int | None = None,
+        ttl: float | None = None,
     ) -> None:
-        self.generators = []
         if isinstance(generators, Generator):
-            self.generators.append(generators)
+            self.generators = (generators,)
         else:
-            self.generators.extend(iter(generators))
-        self.queue = queue or {}
+            self.generators = tuple(generators)
+        if max_size is not None and max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        self.queue = OrderedDict(queue or {})
+        self.max_size = max_size
+        self.default_retries = default_retries
+        self.default_code_length = default_code_length
+        self.ttl = ttl
         self.__total_challenges = 0
+        self.__last_access = {}
+        if ttl is not None:
+            self.__last_access = dict.fromkeys(self.queue, time.monotonic())
+
+    def _drop_expired(self) -> None:
+        if self.ttl is None:
+            return
+        # The queue is ordered from the least to the most recently used challenge, so the
+        # expired challenges are all at its front.
+        now = time.monotonic()
+        deadline = now - self.ttl
+        while self.queue:
+            challenge_id = next(iter(self.queue))
+            last_access = self.__last_access.get(challenge_id)
+            if last_access is None:
+                # The challenge was put in the queue by hand, its lifetime starts now.
+                self.__last_access[challenge_id] = now
+                self.queue.move_to_end(challenge_id)
+                continue
+            if last_access > deadline:
+                break
+            del self.queue[challenge_id]
+            del self.__last_access[challenge_id]
 
     def create_challenge(
         self,
-        challenge_id: typing.Optional[str] = None,
+        challenge_id: str | None = None,
         *,
-        retries: typing.Optional[int] = None,
-        code: typing.Optional[str] = None,
-        code_length: typing.Optional[int] = None,
+        retries: int | None = None,
+        code: str | None = None,
+        code_length: int | None = None,
     ) -> Challenge[_GR]:
         """
         Create a challenge for an id. Overwrite the challenge created before, unless the
@@ -81,11 +159,12 @@ class CaptchaQueue(typing.Generic[_GR]):
         challenge_id : Optional, :py:class:`str`
             The id associated to the challenge. If not given, a random id will be generated.
         retries : Optional, :py:class:`int`
-            The number of allowed retries. Defaults to 3.
+            The number of allowed retries. Defaults to the queue's ``default_retries``.
         code : Optional, :py:class:`str`
             The code to use. Defaults to a random code.
         code_length : Optional, :py:class:`int`
-            The length of the code to generate if no code is supplied. Defaults to 4.
+            The length of the code to generate if no code is supplied. Defaults to the queue's
+            ``default_code_length``.
 
         Returns
         -------
@@ -97,17 +176,34 @@ class CaptchaQueue(typing.Generic[_GR]):
 
            The return type will now be dynamically acquired and adapt to the given generator(s).
         """
+        self._drop_expired()
         challenge_id = challenge_id or str(self.__total_challenges)
 
-        random_generator = random.choice(self.generators)
+        # No need to pick a random generator if there's only one available. The generators
+        # are frozen in a tuple, so this cannot change for the queue's lifetime.
+        if len(self.generators) == 1:
+            random_generator = self.generators[0]
+        else:
+            random_generator = random.choice(self.generators)
         challenge = Challenge(
             random_generator,
             challenge_id,
-            allowed_retries=retries,
+            allowed_retries=retries or self.default_retries,
             code=code,
-            code_length=code_length,
+            code_length=code_length or self.default_code_length,
         )
-        self.queue[str(challenge_id)] = challenge
+        # The challenge already converted its id to a string.
+        self.queue[challenge.challenge_id] = challenge
+        self.queue.move_to_end(challenge.challenge_id)
+        if self.ttl is not None:
+            self.__last_access[challenge.challenge_id] = time.monotonic()
+
+        # Drop the least recently used challenges if the queue grew too big.
+        if self.max_size is not None:
+            while len(self.queue) > self.max_size:
+                dropped_id, _ = self.queue.popitem(last=False)
+                if self.ttl is not None:
+                    self.__last_access.pop(dropped_id, None)
 
         self.__total_challenges += 1
         return challenge
@@ -124,7 +220,7 @@ class CaptchaQueue(typing.Generic[_GR]):
         Raises
         ------
         :py:exc:`~errors.UnexistingChallengeError`:
-            If the given id does not have any associated challenge.
+            If the given id does not have any associated challenge, or if it expired.
 
         Returns
         -------
@@ -137,12 +233,17 @@ class CaptchaQueue(typing.Generic[_GR]):
            The return type will now be dynamically acquired and adapt to the given generator(s).
 
         """
+        self._drop_expired()
         try:
-            return self.queue[challenge_id]
+            challenge = self.queue[challenge_id]
         except KeyError as e:
             raise NonexistingChallengeError(
                 f"Challenge with id '{challenge_id}' does not exist. Have you used an int?"
             ) from e
+        self.queue.move_to_end(challenge_id)
+        if self.ttl is not None:
+            self.__last_access[challenge_id] = time.monotonic()
+        return challenge
 
     def delete_challenge(self, challenge_id: str) -> None:
         """Delete a challenge of an id, if it exist.
@@ -155,8 +256,17 @@ class CaptchaQueue(typing.Generic[_GR]):
         Raises
         ------
         :py:exc:`~errors.UnexistingChallengeError`:
-            If the given id does not have any associated challenge.
+            If the given id does not have any associated challenge, or if it expired.
         """
-        challenge = self.get_challenge(challenge_id)
+        self._drop_expired()
+        challenge = self.queue.get(challenge_id, _MISSING)
+        if challenge is _MISSING:
+            raise NonexistingChallengeError(
+                f"Challenge with id '{challenge_id}' does not exist. Have you used an int?"
+            )
+        # The challenge is only removed once cancelled, a challenge that cannot be cancelled
+        # keeps its place in the queue.
         challenge.cancel()
         del self.queue[challenge_id]
+        if self.ttl is not None:
+            self.__last_access.pop(challenge_id, None)
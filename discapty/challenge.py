@@ -1,8 +1,9 @@
+from __future__ import annotations
+
 import typing
-import uuid
 from enum import Enum
 
-from discapty.captcha import Captcha
+from discapty.captcha import Captcha, _check_code
 from discapty.errors import (
     AlreadyCompletedError,
     AlreadyRunningError,
@@ -10,12 +11,16 @@ from discapty.errors import (
     TooManyRetriesError,
 )
 from discapty.generators import Generator
-from discapty.utils import random_code
+from discapty.utils import random_code, random_uuid
 
 
-class FailReason(Enum):
+class FailReason:
     """
-    An enum with all possible reasons of failing the captcha.
+    All possible reasons of failing the captcha.
+
+    .. versionchanged:: 2.2.0
+
+       This is no longer an enum, reasons are plain strings.
     """
 
     TOO_MANY_RETRIES = "Too many retries"
@@ -43,6 +48,20 @@ class States(Enum):
     FAILURE = "Failure (Unexpected)"
 
 
+# Looking up an Enum's member is costly, those are used in the comparisons made on every check.
+_MODIFIABLE_STATES = (States.PENDING, States.WAITING)
+_COMPLETED_STATES = (States.COMPLETED, States.FAILED)
+_FAILED_STATES = (States.FAILED, States.FAILURE)
+
+# The error raised when beginning a challenge in a given state, with its default message and if
+# the challenge's fail reason should be preferred.
+_BEGIN_ERRORS: dict[States, tuple[type[Exception], str, bool]] = {
+    States.FAILED: (TooManyRetriesError, "Failed (No failed reason)", True),
+    States.FAILURE: (ChallengeCompletionError, "Failure (No failure reason)", True),
+    States.COMPLETED: (AlreadyCompletedError, "Challenge already completed", False),
+    States.WAITING: (AlreadyRunningError, "Challenge is already being ran", False),
+}
+
 _CR = typing.TypeVar("_CR")
 
 
@@ -75,7 +94,8 @@ class Challenge(typing.Generic[_CR]):
         The code to use. If none is supplied, a random code will be generated.
 
     code_length : Optional, :py:class:`int`
-        The length of the code to generate if no code is supplied. Defaults to 4.
+        The length of the code to generate if no code is supplied, and of the codes generated
+        when reloading. Defaults to 4.
 
 
     .. versionadded:: 2.0.0
@@ -87,14 +107,24 @@ class Challenge(typing.Generic[_CR]):
        If the type is not especially indicated in your variable, it should be automatically done.
     """
 
+    __slots__ = (
+        "generator",
+        "challenge_id",
+        "allowed_retries",
+        "failures",
+        "attempted_tries",
+        "state",
+        "fail_reason",
+        "_code",
+        "_code_lower",
+        "_code_length",
+        "__captcha",
+    )
+
     generator: Generator[_CR]
     """
     The generator used with this challenge.
     """
-    code: str
-    """
-    The clear code.
-    """
     challenge_id: str
     """
     The ID of this challenge.
@@ -115,26 +145,29 @@ class Challenge(typing.Generic[_CR]):
     """
     The actual state of the challenge.
     """
-    fail_reason: typing.Optional[str]
+    fail_reason: str | None
     """
     The fail reason, if applicable.
     """
-    __last_captcha_class: typing.Optional[Captcha[_CR]]
-    __last_code: typing.Optional[str]
+    _code: str
+    _code_lower: str
+    _code_length: int | None
+    __captcha: Captcha[_CR] | None
 
     def __init__(
         self,
         generator: Generator[_CR],
-        challenge_id: typing.Optional[str] = None,
+        challenge_id: str | None = None,
         *,
-        allowed_retries: typing.Optional[int] = None,
-        code: typing.Optional[str] = None,
-        code_length: typing.Optional[int] = None,
+        allowed_retries: int | None = None,
+        code: str | None = None,
+        code_length: int | None = None,
     ) -> None:
         self.generator = generator
 
+        self._code_length = code_length
         self.code = code or random_code(code_length)
-        self.challenge_id = str(challenge_id or uuid.uuid4())
+        self.challenge_id = str(challenge_id or random_uuid())
 
         self.allowed_retries = allowed_retries or 3
         self.failures = 0
@@ -143,44 +176,43 @@ class Challenge(typing.Generic[_CR]):
         self.state = States.PENDING
         self.fail_reason = None
 
-        self.__last_captcha_class = None
-        self.__last_code = None
-
     def __repr__(self) -> str:  # pragma: no cover
-        return (
-            f"<Challenge id={self.challenge_id} state={self.state} "
-            "is_completed={self.is_completed}>"
-        )
+        return f"<Challenge id={self.challenge_id} state={self.state.name}>"
 
     def _set_state(
         self,
         state: States,
-        fail_reason: typing.Optional[FailReason] = None,
+        fail_reason: str | None = None,
     ) -> None:
         self.state = state
-        if (
-            self.state
-            in (
-                States.FAILED,
-                States.FAILURE,
-            )
-            and fail_reason
-        ):
-            self.fail_reason = fail_reason.value
+        if self.state in _FAILED_STATES and fail_reason is not None:
+            self.fail_reason = fail_reason
 
     @property
     def _can_be_modified(self) -> bool:
-        return self.state in (
-            States.PENDING,
-            States.WAITING,
-        )
+        return self.state in _MODIFIABLE_STATES
+
+    @property
+    def code(self) -> str:
+        """
+        The clear code.
+        """
+        return self._code
+
+    @code.setter
+    def code(self, value: str) -> None:
+        self._code = value
+        # Pre-computed so that checking answers does not lower the code every time.
+        self._code_lower = value.lower()
+        # The captcha is looked up again only after the code changed.
+        self.__captcha = None
 
     def _create_captcha(self) -> Captcha[_CR]:
-        if not self.__last_captcha_class or (self.code != self.__last_code):
-            generated_captcha = self.generator.generate(self.code)
-            self.__last_captcha_class = Captcha(self.code, generated_captcha)
-            self.__last_code = self.code
-        return self.__last_captcha_class
+        captcha = self.__captcha
+        if captcha is None:
+            code = self._code
+            captcha = self.__captcha = Captcha(code, self.generator.generate(code))
+        return captcha
 
     @property
     def captcha_object(self) -> _CR:
@@ -192,7 +224,7 @@ class Challenge(typing.Generic[_CR]):
         :py:attr:`discapty.constants.GeneratorReturnType` :
             The Captcha object.
         """
-        return self.captcha.captcha_object
+        return self._create_captcha().captcha_object
 
     @property
     def captcha(self) -> Captcha[_CR]:
@@ -216,10 +248,10 @@ class Challenge(typing.Generic[_CR]):
         :py:class:`bool` :
             If the challenge has been completed or failed.
         """
-        return self.state in (States.COMPLETED, States.FAILED)
+        return self.state in _COMPLETED_STATES
 
     @property
-    def is_correct(self) -> typing.Optional[bool]:  # pragma: no cover
+    def is_correct(self) -> bool | None:  # pragma: no cover
         """
         Check if the challenge has been completed. If not, return None. If failed, return False.
 
@@ -228,10 +260,10 @@ class Challenge(typing.Generic[_CR]):
         Optional, :py:class:`bool` :
             If the challenge has been completed with success. If not, return False. If not completed, return None.
         """
-        return self.state == States.COMPLETED if self.is_completed else None
+        return self.state is States.COMPLETED if self.is_completed else None
 
     @property
-    def is_wrong(self) -> typing.Optional[bool]:  # pragma: no cover
+    def is_wrong(self) -> bool | None:  # pragma: no cover
         """
         Check if the challenge has been failed. If not, return None. If completed, return False.
 
@@ -241,7 +273,7 @@ class Challenge(typing.Generic[_CR]):
             If the challenge has been failed. If not, return False. If not completed, return None.
 
         """
-        return self.state == States.FAILED if self.is_completed else None
+        return self.state is States.FAILED if self.is_completed else None
 
     def begin(self) -> _CR:
         """
@@ -269,19 +301,13 @@ class Challenge(typing.Generic[_CR]):
 
            The return type will now be dynamically acquired and adapt to the given generator.
         """
-        if self.state == States.FAILED:
-            reason = self.fail_reason or "Failed (No failed reason)"
-            raise TooManyRetriesError(reason)
-        if self.state == States.FAILURE:
-            reason = self.fail_reason or "Failure (No failure reason)"
-            raise ChallengeCompletionError(reason)
-        if self.state == States.COMPLETED:
-            raise AlreadyCompletedError("Challenge already completed")
-        if self.state == States.WAITING:
-            raise AlreadyRunningError("Challenge is already being ran")
+        error = _BEGIN_ERRORS.get(self.state)
+        if error is not None:
+            error_type, message, use_fail_reason = error
+            raise error_type((use_fail_reason and self.fail_reason) or message)
 
         self._set_state(States.WAITING)
-        return self.captcha_object
+        return self._create_captcha().captcha_object
 
     def check(
         self, answer: str, *, force_casing: bool = False, remove_spaces: bool = True
@@ -317,10 +343,19 @@ class Challenge(typing.Generic[_CR]):
 
         self.attempted_tries += 1
 
-        if not self.captcha.check(answer, force_casing=force_casing, remove_spaces=remove_spaces):
+        # The answer is checked against the code directly, there's no need to generate the
+        # captcha for that.
+        if not _check_code(
+            self._code,
+            self._code_lower,
+            answer,
+            force_casing=force_casing,
+            remove_spaces=remove_spaces,
+        ):
             # If wrong
-            self.failures += 1
-            if self.failures >= self.allowed_retries:
+            failures = self.failures + 1
+            self.failures = failures
+            if failures >= self.allowed_retries:
                 self._set_state(States.FAILED, FailReason.TOO_MANY_RETRIES)
                 raise TooManyRetriesError(self.fail_reason)
             return False
@@ -360,20 +395,23 @@ class Challenge(typing.Generic[_CR]):
         .. versionchanged:: 2.1.0
            The return type will now be dynamically acquired and adapt to the given generator.
 
+        .. versionchanged:: 2.2.0
+           The new code has the length given to the challenge with ``code_length``.
+
         """
         if not self._can_be_modified:
             raise TypeError("Challenge cannot be edited")
-        if self.state == States.PENDING:
+        if self.state is States.PENDING:
             raise TypeError("Challenge is not running")
 
-        self.code = random_code()
+        self.code = random_code(self._code_length)
 
         if increase_attempted_tries:
             self.attempted_tries += 1
             if increase_failures:
                 self.failures += 1
 
-        return self.captcha_object
+        return self._create_captcha().captcha_object
 
     def cancel(self) -> None:
         """
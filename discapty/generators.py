@@ -1,9 +1,9 @@
 import pathlib
 import typing
 from abc import ABC, abstractmethod
-from os import listdir
-from os.path import abspath, dirname, isfile, join
-from random import choice, randint, random, uniform
+from os import scandir
+from os.path import abspath, dirname, join
+from random import choice, choices, randint, random, uniform
 
 import PIL.Image
 import PIL.ImageColor
@@ -18,7 +18,8 @@ from discapty.utils import random_color
 from .wheezylib import image as wheezy_captcha
 
 PATH: str = join(abspath(dirname(__file__)), "fonts")
-DEFAULT_FONTS: typing.List[str] = [join(PATH, f) for f in listdir(PATH) if isfile(join(PATH, f))]
+# scandir gives the file type along with the entries, no stat is needed for each font.
+DEFAULT_FONTS: typing.List[str] = [entry.path for entry in scandir(PATH) if entry.is_file()]
 
 
 _GR = typing.TypeVar("_GR")
@@ -167,7 +168,6 @@ class WheezyGenerator(Generator[PIL.Image.Image]):
 
         fn = wheezy_captcha.captcha(
             drawings=[
-                wheezy_captcha.background(self.background_color.as_hex()),
                 wheezy_captcha.text(
                     fonts=fonts,
                     fonts_sizes=self.fonts_size,
@@ -189,6 +189,7 @@ class WheezyGenerator(Generator[PIL.Image.Image]):
             ],
             width=self.width,
             height=self.height,
+            background_color=self.background_color.as_hex(),
         )
         return fn(text)
 
@@ -221,7 +222,7 @@ class ImageGenerator(Generator[PIL.Image.Image]):
         fonts_sizes: typing.Tuple[int, ...],
     ) -> typing.Tuple[PIL.ImageFont.FreeTypeFont, ...]:
         return tuple(
-            PIL.ImageFont.truetype(n, s)
+            wheezy_captcha.truetype(n, s)
             for n in [f.absolute().as_posix() if isinstance(f, pathlib.Path) else f for f in fonts]
             for s in fonts_sizes
         )
@@ -230,6 +231,8 @@ class ImageGenerator(Generator[PIL.Image.Image]):
     def create_noise_curve(
         image: PIL.Image.Image, color: Color, number: int = 1
     ) -> PIL.Image.Image:
+        draw = PIL.ImageDraw.Draw(image)
+        fill = PIL.ImageColor.getrgb(color.as_hex())
         w, h = image.size
         while number:
             x1 = randint(0, int(w / 5))
@@ -239,9 +242,7 @@ class ImageGenerator(Generator[PIL.Image.Image]):
             points = [x1, y1, x2, y2]
             end = randint(160, 200)
             start = randint(0, 20)
-            PIL.ImageDraw.Draw(image).arc(
-                points, start, end, fill=PIL.ImageColor.getrgb(color.as_hex())
-            )
+            draw.arc(points, start, end, fill=fill)
             number -= 1
         return image
 
@@ -250,39 +251,27 @@ class ImageGenerator(Generator[PIL.Image.Image]):
         image: PIL.Image.Image, color: Color, width: int = 3, number: int = 30
     ) -> PIL.Image.Image:
         draw = PIL.ImageDraw.Draw(image)
+        fill = PIL.ImageColor.getrgb(color.as_hex())
         w, h = image.size
         while number:
             x1 = randint(0, w)
             y1 = randint(0, h)
             pos = ((x1, y1), (x1 - 1, y1 - 1))
-            draw.line(pos, fill=PIL.ImageColor.getrgb(color.as_hex()), width=width)
+            draw.line(pos, fill=fill, width=width)
             number -= 1
         return image
 
     def create_captcha_image(self, *, chars: str) -> PIL.Image.Image:
-        image = PIL.Image.new(
-            "RGB",
-            (self.width, self.height),
-            PIL.ImageColor.getrgb(self.background_color.as_hex()),
-        )
-        draw = PIL.ImageDraw.Draw(image)
+        truefonts = self.get_truefonts()
+        text_color = PIL.ImageColor.getrgb(self.text_color.as_hex())
 
         def _draw_character(char: str) -> PIL.Image.Image:
-            font = choice(self.get_truefonts())
-            _, _, wid, hei = draw.textbbox((0, 0), char, font=font)
-
-            dx = randint(0, 4)
-            dy = randint(0, 6)
-            im = PIL.Image.new("RGBA", (wid + dx, hei + dy))
-            PIL.ImageDraw.Draw(im).text(  # type: ignore
-                (dx, dy),
-                char,
-                font=font,
-                fill=PIL.ImageColor.getrgb(self.text_color.as_hex()),
+            # The cached character is shared, rotate() gives back a new image.
+            im, wid, hei = wheezy_captcha.draw_character(
+                char, choice(truefonts), text_color, "RGBA"
             )
 
             # Rotate
-            im = im.crop(im.getbbox())
             im = im.rotate(uniform(-30, 30), PIL.Image.Resampling.BILINEAR, expand=True)
 
             # Warp
@@ -294,19 +283,26 @@ class ImageGenerator(Generator[PIL.Image.Image]):
             y2 = int(uniform(-dy, dy))
             w2 = wid + abs(x1) + abs(x2)
             h2 = hei + abs(y1) + abs(y2)
+            # The quad is computed for the character resized to (w2, h2). Scaling the quad back
+            # to the character's actual size spares resampling it once more before the warp.
+            sx = im.width / w2
+            sy = im.height / h2
             data = (
-                x1,
-                y1,
-                -x1,
-                h2 - y2,
-                w2 + x2,
-                h2 + y2,
-                w2 - x2,
-                -y1,
+                x1 * sx,
+                y1 * sy,
+                -x1 * sx,
+                (h2 - y2) * sy,
+                (w2 + x2) * sx,
+                (h2 + y2) * sy,
+                (w2 - x2) * sx,
+                -y1 * sy,
+            )
+            return im.transform(
+                (wid, hei),
+                PIL.Image.Transform.QUAD,
+                data,
+                PIL.Image.Resampling.BILINEAR,
             )
-            im = im.resize((w2, h2))
-            im = im.transform((wid, hei), PIL.Image.Transform.QUAD, data)  # type: ignore
-            return im
 
         images: typing.List[PIL.Image.Image] = []
 
@@ -317,8 +313,13 @@ class ImageGenerator(Generator[PIL.Image.Image]):
 
         text_width = sum(im.size[0] for im in images)
 
+        # The background is created directly at its final size, there's no need to resize it.
         width = max(text_width, self.width)
-        image = image.resize((width, self.height))
+        image = PIL.Image.new(
+            "RGB",
+            (width, self.height),
+            PIL.ImageColor.getrgb(self.background_color.as_hex()),
+        )
 
         average = int(text_width / len(chars))
         rand = int(0.25 * average)
@@ -326,12 +327,10 @@ class ImageGenerator(Generator[PIL.Image.Image]):
 
         for im in images:
             w, h = im.size
-            mask = im.convert("L").point([int(i * 1.97) for i in range(256)])  # type: ignore
+            mask = im.convert("L").point(wheezy_captcha.MASK_TABLE)
             image.paste(im, (offset, int((self.height - h) / 2)), mask)
             offset = offset + w + randint(-rand, 0)
 
-        image = image.resize((width, self.height))
-
         return image
 
     def generate(self, text: str) -> PIL.Image.Image:
@@ -382,8 +381,6 @@ class TextGenerator(Generator[str]):
         """
         if isinstance(self.separator, str):
             return self.separator.join(text)
-        new_string: str = ""
-        for position, character in enumerate(text):
-            char = choice(self.separator)
-            new_string += character + (char if position < len(text) - 1 else "")
-        return new_string
+        # A random separator is picked between each character, there's none after the last one.
+        separators = choices(self.separator, k=max(len(text) - 1, 0))
+        return "".join(map(str.__add__, text, separators)) + text[-1:]
@@ -1,6 +1,25 @@
-from random import choices, randint
+import os
+from collections import deque
+from random import randint
 from string import ascii_uppercase, digits
-from typing import Optional
+from typing import Deque, Optional
+
+_CODE_ALPHABET = ascii_uppercase + digits
+# Random bytes are mapped to the alphabet with bytes.translate. Bytes above the last multiple of
+# the alphabet's length are dropped, otherwise the first characters would come up more often.
+_CODE_BYTES_LIMIT = 256 - 256 % len(_CODE_ALPHABET)
+_CODE_TRANSLATION = bytes(
+    ord(_CODE_ALPHABET[i % len(_CODE_ALPHABET)]) if i < _CODE_BYTES_LIMIT else 0
+    for i in range(256)
+)
+_CODE_REJECTED_BYTES = bytes(range(_CODE_BYTES_LIMIT, 256))
+
+_UUID_BATCH_SIZE = 64
+_uuid_pool: Deque[str] = deque()
+
+if hasattr(os, "register_at_fork"):  # pragma: no branch
+    # A forked process must not hand out the same UUIDs as its parent.
+    os.register_at_fork(after_in_child=_uuid_pool.clear)
 
 
 def random_color(start: int = 0, end: int = 255, opacity: int = 0) -> str:
@@ -50,4 +69,39 @@ def random_code(characters_length: Optional[int] = None) -> str:
     :py:class:`str` :
         The random code.
     """
-    return "".join(choices(ascii_uppercase + digits, k=characters_length or 4))
+    length = characters_length or 4
+    code = b""
+    while len(code) < length:
+        # A few more bytes are drawn so that rejected bytes rarely require another round.
+        code += os.urandom(length + 8).translate(_CODE_TRANSLATION, _CODE_REJECTED_BYTES)
+    return code[:length].decode("ascii")
+
+
+def _fill_uuid_pool() -> None:
+    # Reading random bytes for a whole batch of UUIDs at once is much cheaper than a call to
+    # uuid.uuid4() for each one.
+    batch = bytearray(os.urandom(16 * _UUID_BATCH_SIZE))
+    # Set the version (4) and the variant (RFC 4122) bits of every UUID.
+    batch[6::16] = bytes((byte & 0x0F) | 0x40 for byte in batch[6::16])
+    batch[8::16] = bytes((byte & 0x3F) | 0x80 for byte in batch[8::16])
+    h = batch.hex()
+    _uuid_pool.extend(
+        f"{h[i:i + 8]}-{h[i + 8:i + 12]}-{h[i + 12:i + 16]}-{h[i + 16:i + 20]}-{h[i + 20:i + 32]}"
+        for i in range(0, len(h), 32)
+    )
+
+
+def random_uuid() -> str:
+    """
+    Return a random UUID (version 4), formatted like ``str(uuid.uuid4())``.
+
+    Returns
+    -------
+    :py:class:`str` :
+        The random UUID.
+    """
+    while True:
+        try:
+            return _uuid_pool.popleft()
+        except IndexError:
+            _fill_uuid_pool()
@@ -1,6 +1,6 @@
+import functools
 import typing
-from random import randint, random, uniform
-from secrets import choice
+from random import choice, randint, random, uniform
 
 from PIL import Image, ImageColor, ImageDraw, ImageFilter, ImageFont
 
@@ -11,9 +11,13 @@ def captcha(
     drawings: typing.Sequence[typing.Callable[[Image.Image, str], Image.Image]],
     width: int = 200,
     height: int = 75,
+    background_color: str = "#FFFFFF",
 ) -> typing.Callable[[str], Image.Image]:
+    color = ImageColor.getrgb(background_color)
+
     def render(text_input: str) -> Image.Image:
-        img = Image.new("RGB", (width, height), (255, 255, 255))
+        # Copying a filled template is cheaper than allocating and filling a new image.
+        img = _background("RGB", (width, height), color).copy()
         for drawing in drawings:
             img = drawing(img, text_input)
         return img
@@ -21,6 +25,46 @@ def captcha(
     return render
 
 
+MASK_TABLE = [int(i * 1.97) for i in range(256)]
+"""
+Lookup table turning a pasted character into its mask.
+"""
+
+
+@functools.lru_cache(maxsize=32)
+def truetype(font: str, size: int) -> ImageFont.FreeTypeFont:
+    """
+    Load a TrueType font. Loaded fonts are kept, so that the font files are not parsed again
+    for every captcha.
+    """
+    return ImageFont.truetype(font, size)
+
+
+@functools.lru_cache(maxsize=1024)
+def draw_character(
+    character: str, font: ImageFont.FreeTypeFont, color: typing.Tuple[int, ...], mode: str = "RGB"
+) -> typing.Tuple[Image.Image, int, int]:
+    """
+    Draw a character cropped to its ink, on a black (or transparent, depending on the mode)
+    background. Also returns the size of the character's text box.
+
+    A drawn character only depends on the arguments, so it is kept and shared: the returned
+    image must be copied before being modified.
+    """
+    _, _, width, height = map(int, font.getbbox(character))
+    image = Image.new(mode, (width, height))
+    ImageDraw.Draw(image).text((0, 0), character, fill=color, font=font)  # type: ignore
+    return image.crop(image.getbbox()), width, height
+
+
+@functools.lru_cache(maxsize=32)
+def _background(
+    mode: str, size: typing.Tuple[int, int], color: typing.Tuple[int, ...]
+) -> Image.Image:
+    # The returned image is shared, it must be copied before being modified.
+    return Image.new(mode, size, color)
+
+
 # Drawings
 
 
@@ -28,8 +72,9 @@ def background(background_color: str = "#EEEECC"):
     color = ImageColor.getrgb(background_color)
 
     def render(image: Image.Image, _: str) -> Image.Image:
-        ImageDraw.Draw(image).rectangle(((0, 0), image.size), fill=color)
-        return image
+        # The background covers the whole image, copying a filled template is cheaper than
+        # drawing it.
+        return _background(image.mode, image.size, color).copy()
 
     return render
 
@@ -120,13 +165,11 @@ def text(
     text_color: str = "#5C87B2",
     squeeze_factor: float = 0.8,
 ) -> typing.Callable[[Image.Image, str], Image.Image]:
-    tt_fonts = tuple(ImageFont.truetype(name, size) for name in fonts for size in fonts_sizes)
+    tt_fonts = tuple(truetype(name, size) for name in fonts for size in fonts_sizes)
 
     color = ImageColor.getrgb(text_color)
 
     def render(image: Image.Image, text_input: str) -> Image.Image:
-        draw = ImageDraw.Draw(image)
-
         # We will make a loop for each character in input, so we can
         # use drawings on each character and create a more wheezy-like
         # result.
@@ -134,15 +177,8 @@ def text(
         characters: typing.List[Image.Image] = []
 
         for input_character in text_input:
-            # Mostly setting up things here...
-            rand_font = choice(tt_fonts)
-            _, _, char_width, char_height = draw.textbbox((0, 0), input_character, font=rand_font)
-            character = Image.new("RGB", (char_width, char_height), (0, 0, 0))
-            character_draw = ImageDraw.Draw(character)
-
-            # Draw the actual character
-            character_draw.text((0, 0), input_character, fill=color, font=rand_font)  # type: ignore
-            character = character.crop(character.getbbox())
+            # Draw the actual character. It is copied as drawings may modify it.
+            character = draw_character(input_character, choice(tt_fonts), color)[0].copy()
 
             # Applies drawings
             if drawings:
@@ -164,7 +200,7 @@ def text(
         # Paste characters into final image
         for character in characters:
             character_width, character_height = character.size
-            mask = character.convert("L").point(lambda x: int(x * 1.97))  # type: ignore
+            mask = character.convert("L").point(MASK_TABLE)
             image.paste(character, (image_offset, int((height - character_height) / 2)), mask)
             image_offset += int(character_width * squeeze_factor)
 
@@ -33,3 +33,11 @@ class TestCaptcha(unittest.TestCase):
         """
         self.assertFalse(self.captcha.check("TE ST", remove_spaces=False))
         self.assertTrue(self.captcha.check("TE ST", remove_spaces=True))
+
+    def test_code_change(self):
+        """
+        Ensure that the check follows a change of code.
+        """
+        self.captcha.code = "OTHER"
+        self.assertFalse(self.captcha.check("test"))
+        self.assertTrue(self.captcha.check("other"))
@@ -1,4 +1,5 @@
 import unittest
+import unittest.mock
 
 import discapty
 from discapty import CaptchaQueue, Challenge
@@ -70,3 +71,90 @@ class TestCaptchaQueue(unittest.TestCase):
         self.queue.delete_challenge(challenge_id)
 
         self.assertNotIn(challenge_id, self.queue.queue)
+
+    def test_max_size(self):
+        """
+        Ensure that the least recently used challenges are dropped when the queue is full.
+        """
+        queue: CaptchaQueue[str] = CaptchaQueue(TextGenerator(), max_size=2)
+        first = queue.create_challenge().challenge_id
+        second = queue.create_challenge().challenge_id
+        queue.get_challenge(first)
+        third = queue.create_challenge().challenge_id
+
+        self.assertEqual(list(queue.queue), [first, third])
+        self.assertNotIn(second, queue.queue)
+
+        with self.assertRaises(ValueError):
+            CaptchaQueue(TextGenerator(), max_size=0)
+
+    def test_default_challenge_arguments(self):
+        """
+        Ensure that the queue's defaults are used when creating a challenge.
+        """
+        queue: CaptchaQueue[str] = CaptchaQueue(
+            TextGenerator(), default_retries=5, default_code_length=8
+        )
+        challenge = queue.create_challenge()
+        self.assertEqual(challenge.allowed_retries, 5)
+        self.assertEqual(len(challenge.code), 8)
+
+        challenge = queue.create_challenge(retries=1, code_length=2)
+        self.assertEqual(challenge.allowed_retries, 1)
+        self.assertEqual(len(challenge.code), 2)
+
+    def test_ttl(self):
+        """
+        Ensure that challenges that are not used anymore expire.
+        """
+        with unittest.mock.patch("time.monotonic", return_value=0.0) as monotonic:
+            queue: CaptchaQueue[str] = CaptchaQueue(TextGenerator(), ttl=10)
+            first = queue.create_challenge().challenge_id
+            monotonic.return_value = 5.0
+            second = queue.create_challenge().challenge_id
+
+            monotonic.return_value = 12.0
+            with self.assertRaises(discapty.NonexistingChallengeError):
+                queue.get_challenge(first)
+            self.assertEqual(queue.get_challenge(second).challenge_id, second)
+
+            monotonic.return_value = 23.0
+            with self.assertRaises(discapty.NonexistingChallengeError):
+                queue.delete_challenge(second)
+            third = queue.create_challenge().challenge_id
+            self.assertEqual(list(queue.queue), [third])
+
+    def test_ttl_keeps_challenges_added_by_hand(self):
+        """
+        Ensure that challenges put directly in the queue are not dropped as expired.
+        """
+        with unittest.mock.patch("time.monotonic", return_value=100.0) as monotonic:
+            queue: CaptchaQueue[str] = CaptchaQueue(TextGenerator(), ttl=10)
+            challenge = Challenge(TextGenerator(), "manual")
+            queue.queue["manual"] = challenge
+            queue.create_challenge()
+            self.assertIs(queue.get_challenge("manual"), challenge)
+
+            monotonic.return_value = 120.0
+            with self.assertRaises(discapty.NonexistingChallengeError):
+                queue.get_challenge("manual")
+
+    def test_failed_delete_keeps_queue_unchanged(self):
+        """
+        Ensure that a challenge that cannot be deleted keeps its place and its expiry.
+        """
+        with unittest.mock.patch("time.monotonic", return_value=0.0) as monotonic:
+            queue: CaptchaQueue[str] = CaptchaQueue(TextGenerator(), max_size=2, ttl=10)
+            completed = queue.create_challenge(code="abcd")
+            completed.begin()
+            completed.check("abcd")
+            other = queue.create_challenge().challenge_id
+
+            monotonic.return_value = 5.0
+            with self.assertRaises(TypeError):
+                queue.delete_challenge(completed.challenge_id)
+            self.assertEqual(list(queue.queue), [completed.challenge_id, other])
+
+            monotonic.return_value = 12.0
+            with self.assertRaises(discapty.NonexistingChallengeError):
+                queue.get_challenge(completed.challenge_id)
@@ -3,6 +3,7 @@
 #   license.
 
 import unittest
+import unittest.mock
 
 from discapty import (
     AlreadyCompletedError,
@@ -10,6 +11,7 @@ from discapty import (
     Challenge,
     ChallengeCompletionError,
     States,
+    TextGenerator,
     TooManyRetriesError,
     WheezyGenerator,
 )
@@ -70,6 +72,11 @@ class TestChallenge(unittest.TestCase):
         challenge.reload(increase_attempted_tries=False)
         self.assertEqual(challenge.attempted_tries, 1)
 
+        challenge = Challenge(WheezyGenerator(width=500, height=300), code_length=8)
+        challenge.begin()
+        challenge.reload()
+        self.assertEqual(len(challenge.code), 8)
+
     def test_ensure_captcha_is_same(self):
         """
         Ensure that the same captcha is generated each time.
@@ -99,6 +106,17 @@ class TestChallenge(unittest.TestCase):
         self.assertIs(challenge.failures, 1)
         self.assertIs(challenge.state, States.COMPLETED)
 
+    def test_check_does_not_generate(self):
+        """
+        Ensure that checking an answer does not generate the captcha.
+        """
+        generator = TextGenerator()
+        challenge = Challenge(generator, code="TEST")
+
+        with unittest.mock.patch.object(TextGenerator, "generate") as generate:
+            self.assertTrue(challenge.check("test"))
+        generate.assert_not_called()
+
     def test_ensure_failures(self):  # sourcery skip: class-extract-method
         """
         Ensure that the challenge raises an error if too many fails.
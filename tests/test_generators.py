@@ -94,6 +94,15 @@ class TestImageGenerator(unittest.TestCase):
 
         self.assertIsInstance(result, PIL.Image.Image)
 
+    def test_fonts_are_reused(self):
+        """
+        Ensure that fonts are loaded once and shared between generators.
+        """
+        first = ImageGenerator(text_color="#5C87B2").get_truefonts()  # type: ignore
+        second = ImageGenerator(text_color="#000000").get_truefonts()  # type: ignore
+
+        self.assertEqual([id(font) for font in first], [id(font) for font in second])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,38 @@
+#  Copyright (c) 2022​-present - Predeactor - Licensed under the MIT License.
+#  See the LICENSE file included with the file for more information about this project's
+#   license.
+
+import string
+import unittest
+import uuid
+
+from discapty.utils import random_code, random_uuid
+
+
+class TestUtils(unittest.TestCase):
+    """
+    Test the discapty.utils functions.
+    """
+
+    def test_random_code(self):
+        """
+        Ensure that random codes have the requested length and only use the alphabet.
+        """
+        self.assertEqual(len(random_code()), 4)
+        code = random_code(500)
+        self.assertEqual(len(code), 500)
+        self.assertTrue(set(code) <= set(string.ascii_uppercase + string.digits))
+
+    def test_random_uuid(self):
+        """
+        Ensure that random UUIDs are unique, valid version 4 UUIDs.
+        """
+        uuids = {random_uuid() for _ in range(1000)}
+        self.assertEqual(len(uuids), 1000)
+        for value in uuids:
+            self.assertEqual(str(uuid.UUID(value)), value)
+            self.assertEqual(uuid.UUID(value).version, 4)
+
+
+if __name__ == "__main__":
+    unittest.main()